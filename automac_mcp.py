@@ -1,27 +1,815 @@
 #!/usr/bin/env python3
 
 import subprocess
+import bisect
+import importlib
 import json
+import os
+import threading
 import time
-from typing import Any, Dict, List, Optional
-import pyautogui
-import easyocr
-import numpy as np
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional
 from mcp.server.fastmcp import FastMCP
-try:
-    from Cocoa import NSWorkspace
-    from Quartz import CGWindowListCopyWindowInfo, kCGWindowListOptionOnScreenOnly, kCGNullWindowID, CGEventCreateScrollWheelEvent, CGEventPost, kCGScrollEventUnitPixel, kCGHIDEventTap
-    from ApplicationServices import AXUIElementCreateApplication, AXUIElementCopyAttributeValue, kAXWindowsAttribute, kAXTitleAttribute, kAXPositionAttribute, kAXSizeAttribute, kAXRoleAttribute
-    ACCESSIBILITY_AVAILABLE = True
-except ImportError:
-    ACCESSIBILITY_AVAILABLE = False
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class _LazyModule:
+    """Module proxy that imports the real module on first attribute access.
+
+    Heavy dependencies are loaded only when a tool that needs them is first called,
+    so the server can register its tools and accept connections straight away.
+    """
+
+    def __init__(self, name: str, on_load: Optional[Callable[[Any], None]] = None):
+        self._name = name
+        self._on_load = on_load
+        self._module = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Any:
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    module = importlib.import_module(self._name)
+                    if self._on_load is not None:
+                        self._on_load(module)
+                    self._module = module
+        return self._module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+
+def _configure_pyautogui(module: Any) -> None:
+    module.FAILSAFE = True
+
+
+pyautogui = _LazyModule("pyautogui", on_load=_configure_pyautogui)
+easyocr = _LazyModule("easyocr")
+np = _LazyModule("numpy")
+Cocoa = _LazyModule("Cocoa")
+Quartz = _LazyModule("Quartz")
+
+# Modules each group of tools needs; AUTOMAC_PRELOAD=input,ocr loads groups in the background at startup
+TOOL_GROUP_MODULES = {
+    "input": (pyautogui, Quartz),
+    "ocr": (np, easyocr, pyautogui),
+    "accessibility": (Cocoa, Quartz),
+}
+
+
+@lru_cache(maxsize=None)
+def _accessibility_available() -> bool:
+    """Check whether the macOS accessibility frameworks can be imported."""
+    try:
+        Cocoa._load()
+        Quartz._load()
+        return True
+    except ImportError:
+        return False
+
+
+def _preload_tool_groups(groups: List[str]) -> None:
+    """Import the modules of the given tool groups, ignoring ones that are not installed."""
+    for group in groups:
+        for module in TOOL_GROUP_MODULES.get(group.strip(), ()):
+            try:
+                module._load()
+            except ImportError:
+                pass
+
 
 # Initialize the MCP server
 mcp = FastMCP("AutoMac MCP - macOS UI Automation")
 
-# Initialize OCR reader and pyautogui settings
-reader = easyocr.Reader(['en'])
-pyautogui.FAILSAFE = True
+# OCR reader pool settings
+DEFAULT_OCR_LANGUAGES = ['en']
+OCR_MEMORY_LIMIT_MB = float(os.environ.get("AUTOMAC_OCR_MEMORY_LIMIT_MB", "1024"))
+# Lower threshold for general screen reading
+OCR_MIN_CONFIDENCE = 0.3
+# Used when a loaded reader's model size cannot be measured
+_OCR_READER_FALLBACK_MB = 100.0
+
+
+def _estimate_reader_memory_mb(ocr_reader: Any) -> float:
+    """Estimate the memory held by an easyocr reader from its model parameters."""
+    total_bytes = 0
+    for model in (getattr(ocr_reader, "detector", None), getattr(ocr_reader, "recognizer", None)):
+        if model is None:
+            continue
+        try:
+            total_bytes += sum(p.numel() * p.element_size() for p in model.parameters())
+        except Exception:
+            pass
+    if total_bytes == 0:
+        return _OCR_READER_FALLBACK_MB
+    return round(total_bytes / (1024 * 1024), 1)
+
+
+class _OCRReaderPool:
+    """Pool of easyocr readers keyed by language set.
+
+    Readers are loaded on first use. Before a load, the least recently used idle
+    readers are evicted until the loaded readers plus the expected size of the new
+    one fit within the memory limit.
+    """
+
+    def __init__(self, memory_limit_mb: float, factory=None, max_events: int = 50):
+        self.memory_limit_mb = memory_limit_mb
+        self._factory = factory or (lambda languages: easyocr.Reader(list(languages)))
+        self._readers: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._events: deque = deque(maxlen=max_events)
+        # Last measured size per language set, used to make room before reloading it
+        self._measured_mb: Dict[tuple, float] = {}
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+
+    @staticmethod
+    def normalize_languages(languages: Optional[List[str]]) -> tuple:
+        """Turn a language list into a stable pool key."""
+        cleaned = sorted({lang.strip() for lang in (languages or []) if lang and lang.strip()})
+        return tuple(cleaned) if cleaned else tuple(DEFAULT_OCR_LANGUAGES)
+
+    def _record(self, event: str, key: tuple, **details: Any) -> Dict[str, Any]:
+        entry = {"event": event, "languages": list(key), "timestamp": time.time(), **details}
+        self._events.append(entry)
+        return entry
+
+    def _evict_idle(self, keep: tuple, events: List[Dict[str, Any]], reserve_mb: float = 0.0) -> None:
+        # Caller must hold the lock; reserve_mb is room needed for a reader about to be loaded
+        for key in list(self._readers):
+            if self.memory_mb() + reserve_mb <= self.memory_limit_mb:
+                return
+            entry = self._readers[key]
+            if key == keep or entry["in_use"] > 0:
+                continue
+            del self._readers[key]
+            events.append(self._record(
+                "evict", key,
+                memory_mb=entry["memory_mb"],
+                idle_seconds=round(time.time() - entry["last_used"], 2)
+            ))
+
+    def _acquire_loaded(self, key: tuple) -> Optional[Dict[str, Any]]:
+        """Mark an already loaded reader as in use, if there is one."""
+        with self._lock:
+            entry = self._readers.get(key)
+            if entry is not None:
+                self._readers.move_to_end(key)
+                entry["in_use"] += 1
+            return entry
+
+    def memory_mb(self) -> float:
+        """Estimated memory held by all loaded readers."""
+        return round(sum(entry["memory_mb"] for entry in self._readers.values()), 1)
+
+    @contextmanager
+    def reader(self, languages: Optional[List[str]], events: Optional[List[Dict[str, Any]]] = None) -> Iterator[Any]:
+        """Borrow the reader for a language set, loading it if needed.
+
+        Load and eviction events caused by this call are appended to ``events``.
+        """
+        key = self.normalize_languages(languages)
+        if events is None:
+            events = []
+
+        entry = self._acquire_loaded(key)
+        if entry is None:
+            # Loads are serialized but run outside the pool lock, so status queries and
+            # lookups of loaded readers are not blocked behind a slow model load
+            with self._load_lock:
+                entry = self._acquire_loaded(key)
+                if entry is None:
+                    # Make room before loading so peak memory stays within the limit
+                    with self._lock:
+                        reserve_mb = self._measured_mb.get(key, _OCR_READER_FALLBACK_MB)
+                        self._evict_idle(keep=key, events=events, reserve_mb=reserve_mb)
+
+                    start_time = time.time()
+                    ocr_reader = self._factory(key)
+                    entry = {
+                        "reader": ocr_reader,
+                        "memory_mb": _estimate_reader_memory_mb(ocr_reader),
+                        "in_use": 1,
+                        "last_used": time.time()
+                    }
+
+                    with self._lock:
+                        self._readers[key] = entry
+                        self._measured_mb[key] = entry["memory_mb"]
+                        events.append(self._record(
+                            "load", key,
+                            memory_mb=entry["memory_mb"],
+                            load_seconds=round(time.time() - start_time, 2)
+                        ))
+                        # The measured size may exceed the estimate
+                        self._evict_idle(keep=key, events=events)
+
+        try:
+            yield entry["reader"]
+        finally:
+            with self._lock:
+                entry["in_use"] -= 1
+                entry["last_used"] = time.time()
+
+    def status(self) -> Dict[str, Any]:
+        """Describe the loaded readers (least recently used first) and recent events."""
+        with self._lock:
+            return {
+                "memory_limit_mb": self.memory_limit_mb,
+                "memory_mb": self.memory_mb(),
+                "readers": [
+                    {
+                        "languages": list(key),
+                        "memory_mb": entry["memory_mb"],
+                        "in_use": entry["in_use"],
+                        "idle_seconds": round(time.time() - entry["last_used"], 2)
+                    }
+                    for key, entry in self._readers.items()
+                ],
+                "recent_events": list(self._events)
+            }
+
+
+ocr_readers = _OCRReaderPool(OCR_MEMORY_LIMIT_MB)
+
+# Screen change detection settings
+DEFAULT_CHANGE_DETECTION_FPS = 2.0
+_CHANGE_DETECTION_DOWNSCALE = 4
+_CHANGE_DETECTION_BLOCK_SIZE = 16
+
+
+def _block_hashes(frame: "np.ndarray", block_size: int) -> "np.ndarray":
+    """Hash each block_size x block_size block of a grayscale frame.
+
+    The frame is zero-padded to a multiple of block_size, so partial blocks at the
+    right and bottom edges are hashed too.
+    """
+    rows, cols = -(-frame.shape[0] // block_size), -(-frame.shape[1] // block_size)
+    blocks = np.zeros((rows * block_size, cols * block_size), dtype=np.uint64)
+    blocks[:frame.shape[0], :frame.shape[1]] = frame
+    blocks = blocks.reshape(rows, block_size, cols, block_size)
+    # Weighted sum with fixed odd multipliers; uint64 arithmetic wraps around
+    weights = (np.arange(block_size * block_size, dtype=np.uint64) * np.uint64(2654435761) + np.uint64(1)) | np.uint64(1)
+    weights = weights.reshape(1, block_size, 1, block_size)
+    return (blocks * weights).sum(axis=(1, 3), dtype=np.uint64)
+
+
+def _dirty_rectangles(
+    dirty: "np.ndarray", block_pixels: int, bounds: Optional[tuple[int, int]] = None
+) -> List[Dict[str, int]]:
+    """Merge a grid of changed blocks into bounding rectangles of connected regions.
+
+    When bounds (width, height) are given, rectangles are clipped to them.
+    """
+    rows, cols = dirty.shape
+    seen = set()
+    rectangles = []
+    for start in zip(*np.nonzero(dirty)):
+        start = (int(start[0]), int(start[1]))
+        if start in seen:
+            continue
+        seen.add(start)
+        stack = [start]
+        top, left, bottom, right = start[0], start[1], start[0], start[1]
+        while stack:
+            row, col = stack.pop()
+            top, bottom = min(top, row), max(bottom, row)
+            left, right = min(left, col), max(right, col)
+            for next_row, next_col in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+                if (0 <= next_row < rows and 0 <= next_col < cols
+                        and dirty[next_row, next_col] and (next_row, next_col) not in seen):
+                    seen.add((next_row, next_col))
+                    stack.append((next_row, next_col))
+        x, y = left * block_pixels, top * block_pixels
+        width, height = (right - left + 1) * block_pixels, (bottom - top + 1) * block_pixels
+        if bounds is not None:
+            width, height = min(width, bounds[0] - x), min(height, bounds[1] - y)
+        rectangles.append({"x": x, "y": y, "width": width, "height": height})
+    return rectangles
+
+
+def _rectangles_intersect(a: Dict[str, int], b: Dict[str, int]) -> bool:
+    return (a["x"] < b["x"] + b["width"] and b["x"] < a["x"] + a["width"]
+            and a["y"] < b["y"] + b["height"] and b["y"] < a["y"] + a["height"])
+
+
+class _ScreenChangeDetector:
+    """Detects which areas of the screen changed between samples.
+
+    Each sample is converted to grayscale, downscaled and split into blocks whose
+    hashes are compared with the previous sample. Changed blocks are merged into
+    dirty rectangles (in screenshot pixels) and published as numbered events to an
+    event log and to registered listeners. Sampling runs on a background thread
+    while started, and can also be triggered directly with sample().
+    """
+
+    def __init__(
+        self,
+        downscale: int = _CHANGE_DETECTION_DOWNSCALE,
+        block_size: int = _CHANGE_DETECTION_BLOCK_SIZE,
+        capture: Optional[Callable[[], "np.ndarray"]] = None,
+        max_events: int = 200
+    ):
+        self.downscale = downscale
+        self.block_size = block_size
+        self.fps = DEFAULT_CHANGE_DETECTION_FPS
+        self._capture = capture or self._capture_screen
+        self._hashes = None
+        self._sequence = 0
+        self._events: deque = deque(maxlen=max_events)
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self._sample_lock = threading.Lock()
+        self._changed = threading.Condition()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._samples = 0
+        self._sample_cpu_seconds = 0.0
+        self._sample_child_cpu_seconds = 0.0
+        # Size of the last real screenshot; custom captures are assumed to be exactly downscaled
+        self._screen_size: Optional[tuple[int, int]] = None
+        self.last_error: Optional[str] = None
+
+    def _capture_screen(self) -> "np.ndarray":
+        screenshot = pyautogui.screenshot()
+        self._screen_size = screenshot.size
+        return np.array(screenshot.convert("L").reduce(self.downscale))
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def sequence(self) -> int:
+        """Number of the latest change event; unchanged while the screen is unchanged."""
+        return self._sequence
+
+    def add_listener(self, listener: Callable[[Dict[str, Any]], None]) -> None:
+        """Call listener with every change event, e.g. to invalidate a cache."""
+        self._listeners.append(listener)
+
+    def sample(self) -> Optional[Dict[str, Any]]:
+        """Capture one frame and publish a change event if it differs from the previous one."""
+        with self._sample_lock:
+            start_cpu = time.thread_time()
+            # On macOS the capture runs in a `screencapture` child process; child CPU is
+            # per process, so it also counts children of tools running at the same time
+            start_children = os.times()
+            frame = self._capture()
+            hashes = _block_hashes(frame, self.block_size)
+            # Image.reduce rounds up, so clip to the real screenshot size when known
+            bounds = self._screen_size or (frame.shape[1] * self.downscale, frame.shape[0] * self.downscale)
+            block_pixels = self.block_size * self.downscale
+            previous, self._hashes = self._hashes, hashes
+            if previous is None:
+                rectangles = []
+            elif previous.shape != hashes.shape:
+                # Resolution changed: treat the whole screen as dirty
+                rectangles = _dirty_rectangles(np.ones(hashes.shape, dtype=bool), block_pixels, bounds)
+            else:
+                rectangles = _dirty_rectangles(previous != hashes, block_pixels, bounds)
+            self._samples += 1
+            end_children = os.times()
+            self._sample_cpu_seconds += time.thread_time() - start_cpu
+            self._sample_child_cpu_seconds += (
+                (end_children.children_user - start_children.children_user)
+                + (end_children.children_system - start_children.children_system)
+            )
+
+        if not rectangles:
+            return None
+
+        with self._changed:
+            self._sequence += 1
+            event = {
+                "sequence": self._sequence,
+                "timestamp": time.time(),
+                "rectangles": rectangles
+            }
+            self._events.append(event)
+            self._changed.notify_all()
+
+        for listener in list(self._listeners):
+            try:
+                listener(event)
+            except Exception:
+                pass
+        return event
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            started = time.time()
+            try:
+                self.sample()
+                self.last_error = None
+            except Exception as e:
+                self.last_error = str(e)
+            self._stop_event.wait(max(0.0, 1.0 / self.fps - (time.time() - started)))
+
+    def start(self, fps: float = DEFAULT_CHANGE_DETECTION_FPS) -> None:
+        """Start sampling in the background, or change the rate if already running."""
+        self.fps = fps
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="screen-change-detector", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop background sampling."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def events_since(self, sequence: int) -> List[Dict[str, Any]]:
+        """Change events newer than the given sequence number still held in the event log."""
+        with self._changed:
+            return [event for event in self._events if event["sequence"] > sequence]
+
+    def wait_for_change(
+        self, timeout: float, region: Optional[Dict[str, int]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Wait for a change event (touching region, if given) that happens after this call.
+
+        When background sampling is not running, frames are sampled on the calling thread.
+        """
+        deadline = time.time() + timeout
+        if not self.running:
+            # Fresh baseline so only changes after this call are reported
+            self.sample()
+        after = self._sequence
+
+        while True:
+            for event in self.events_since(after):
+                after = event["sequence"]
+                if region is None or any(_rectangles_intersect(rect, region) for rect in event["rectangles"]):
+                    return event
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return None
+            if self.running:
+                with self._changed:
+                    if self._sequence == after:
+                        self._changed.wait(remaining)
+            else:
+                time.sleep(min(remaining, 1.0 / self.fps))
+                self.sample()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "fps": self.fps,
+            "downscale": self.downscale,
+            "block_size": self.block_size,
+            "samples": self._samples,
+            "avg_sample_cpu_ms": round(
+                (self._sample_cpu_seconds + self._sample_child_cpu_seconds) / self._samples * 1000, 2
+            ) if self._samples else None,
+            "avg_sample_capture_child_cpu_ms": round(
+                self._sample_child_cpu_seconds / self._samples * 1000, 2
+            ) if self._samples else None,
+            "sequence": self._sequence,
+            "last_error": self.last_error
+        }
+
+
+screen_changes = _ScreenChangeDetector()
+
+# Cached window state is refreshed once it is older than this, even without a change event,
+# since windows can close, move or be renamed behind others without changing visible pixels
+WINDOW_CACHE_MAX_AGE = float(os.environ.get("AUTOMAC_WINDOW_CACHE_MAX_AGE", "0.5"))
+
+
+def _timestamp() -> str:
+    """Current local time in the same format as the `date` command."""
+    return time.strftime("%a %b %d %H:%M:%S %Z %Y")
+
+
+def _list_on_screen_windows() -> List[Dict[str, Any]]:
+    """Read on-screen windows from Quartz, front to back."""
+    window_list = Quartz.CGWindowListCopyWindowInfo(Quartz.kCGWindowListOptionOnScreenOnly, Quartz.kCGNullWindowID)
+    windows = []
+    for z_order, window in enumerate(window_list):
+        window_bounds = window.get('kCGWindowBounds', {})
+        windows.append({
+            "id": int(window.get('kCGWindowNumber', -1)),
+            "title": window.get('kCGWindowName', '') or '',
+            "app": window.get('kCGWindowOwnerName', 'Unknown'),
+            "bounds": {
+                "x": int(window_bounds.get('X', 0)),
+                "y": int(window_bounds.get('Y', 0)),
+                "width": int(window_bounds.get('Width', 0)),
+                "height": int(window_bounds.get('Height', 0))
+            },
+            "layer": window.get('kCGWindowLayer', 0),
+            "z_order": z_order,
+            "pid": window.get('kCGWindowOwnerPID', -1)
+        })
+    return windows
+
+
+def _window_state(window: Dict[str, Any]) -> Dict[str, Any]:
+    """Window fields that describe the window itself, leaving out its stacking position."""
+    return {key: value for key, value in window.items() if key != "z_order"}
+
+
+def _restacked_window_ids(previous_ids: List[int], current_ids: List[int]) -> List[int]:
+    """Ids of windows that moved in the front-to-back order, ignoring added and removed windows.
+
+    The windows that kept their relative order form the longest increasing run of
+    previous positions; every other surviving window was restacked.
+    """
+    previous_position = {window_id: index for index, window_id in enumerate(previous_ids)}
+    surviving = [window_id for window_id in current_ids if window_id in previous_position]
+
+    # Longest increasing subsequence of previous positions, with back-links to recover it
+    tails: List[int] = []
+    tail_indexes: List[int] = []
+    parents: List[int] = [-1] * len(surviving)
+    for index, window_id in enumerate(surviving):
+        position = previous_position[window_id]
+        slot = bisect.bisect_left(tails, position)
+        if slot == len(tails):
+            tails.append(position)
+            tail_indexes.append(index)
+        else:
+            tails[slot] = position
+            tail_indexes[slot] = index
+        parents[index] = tail_indexes[slot - 1] if slot > 0 else -1
+
+    kept = set()
+    index = tail_indexes[-1] if tail_indexes else -1
+    while index != -1:
+        kept.add(surviving[index])
+        index = parents[index]
+    return [window_id for window_id in surviving if window_id not in kept]
+
+
+class _WindowCache:
+    """On-screen window state keyed by window id.
+
+    Refreshed on demand, when a screen change event or a window action marks it
+    stale, or once it is older than max_age.
+    """
+
+    def __init__(self, max_age: float, list_windows: Optional[Callable[[], List[Dict[str, Any]]]] = None):
+        self.max_age = max_age
+        self._list_windows = list_windows or _list_on_screen_windows
+        self._windows: Dict[int, Dict[str, Any]] = {}
+        self._ordered: List[Dict[str, Any]] = []
+        self._refreshed_at: Optional[float] = None
+        self._stale = True
+        self._last_changes: Dict[str, List[int]] = {"added": [], "removed": [], "changed": [], "reordered": []}
+        self._lock = threading.Lock()
+
+    def invalidate(self, event: Optional[Dict[str, Any]] = None) -> None:
+        """Mark the cached state stale; usable as a screen change listener."""
+        self._stale = True
+
+    def _needs_refresh(self) -> bool:
+        if self._stale or self._refreshed_at is None:
+            return True
+        return time.time() - self._refreshed_at > self.max_age
+
+    def refresh(self) -> Dict[str, List[int]]:
+        """Re-read window state and return the ids of added, removed, changed and reordered windows."""
+        with self._lock:
+            self._stale = False
+            windows = self._list_windows()
+            current = {window["id"]: window for window in windows}
+            changes = {
+                "added": [window_id for window_id in current if window_id not in self._windows],
+                "removed": [window_id for window_id in self._windows if window_id not in current],
+                # Title, bounds, layer or owner changed
+                "changed": [
+                    window_id for window_id, window in current.items()
+                    if window_id in self._windows
+                    and _window_state(self._windows[window_id]) != _window_state(window)
+                ],
+                # Moved in the stacking order, e.g. raised to the front
+                "reordered": _restacked_window_ids(
+                    [w["id"] for w in sorted(self._windows.values(), key=lambda w: w["z_order"])],
+                    [w["id"] for w in sorted(windows, key=lambda w: w["z_order"])]
+                )
+            }
+            self._windows = current
+            # Sort windows by layer (front to back)
+            self._ordered = sorted(windows, key=lambda w: (w["layer"], w["z_order"]))
+            self._refreshed_at = time.time()
+            self._last_changes = changes
+            return changes
+
+    def windows(
+        self,
+        app: Optional[str] = None,
+        pid: Optional[int] = None,
+        pids: Optional[List[int]] = None,
+        min_width: int = 0,
+        min_height: int = 0,
+        titled_only: bool = True,
+        refresh: bool = False
+    ) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Filtered windows ordered front to back, and information about the cache state."""
+        refreshed = False
+        if refresh or self._needs_refresh():
+            self.refresh()
+            refreshed = True
+
+        app_name = app.lower() if app else None
+        matches = [
+            window for window in self._ordered
+            if (not titled_only or window["title"])
+            and window["bounds"]["width"] >= min_width
+            and window["bounds"]["height"] >= min_height
+            and (app_name is None or window["app"].lower() == app_name)
+            and (pid is None or window["pid"] == pid)
+            and (pids is None or window["pid"] in pids)
+        ]
+        cache_info = {
+            "refreshed": refreshed,
+            "age_seconds": round(time.time() - self._refreshed_at, 3),
+            "window_count": len(self._windows),
+            "changes": self._last_changes if refreshed else {"added": [], "removed": [], "changed": [], "reordered": []}
+        }
+        return matches, cache_info
+
+
+window_cache = _WindowCache(WINDOW_CACHE_MAX_AGE)
+screen_changes.add_listener(window_cache.invalidate)
+
+
+class _NSWorkspaceAppProvider:
+    """Running applications and launch/terminate notifications from NSWorkspace."""
+
+    @staticmethod
+    def _describe(app: Any) -> Dict[str, Any]:
+        return {
+            "name": str(app.localizedName() or ""),
+            "bundle_id": str(app.bundleIdentifier()) if app.bundleIdentifier() else None,
+            "pid": int(app.processIdentifier()),
+            "background_only": app.activationPolicy() == Cocoa.NSApplicationActivationPolicyProhibited,
+            "handle": app
+        }
+
+    def running_applications(self) -> List[Dict[str, Any]]:
+        workspace = Cocoa.NSWorkspace.sharedWorkspace()
+        return [self._describe(app) for app in workspace.runningApplications()]
+
+    def subscribe(
+        self,
+        on_launch: Callable[[Dict[str, Any]], None],
+        on_terminate: Callable[[Dict[str, Any]], None]
+    ) -> None:
+        center = Cocoa.NSWorkspace.sharedWorkspace().notificationCenter()
+        for notification_name, callback in (
+            (Cocoa.NSWorkspaceDidLaunchApplicationNotification, on_launch),
+            (Cocoa.NSWorkspaceDidTerminateApplicationNotification, on_terminate)
+        ):
+            center.addObserverForName_object_queue_usingBlock_(
+                notification_name, None, None,
+                lambda notification, callback=callback: callback(
+                    self._describe(notification.userInfo()[Cocoa.NSWorkspaceApplicationKey])
+                )
+            )
+
+    def pump(self) -> None:
+        """Deliver pending workspace notifications.
+
+        NSWorkspace updates and notifications arrive through the main run loop,
+        which the MCP server does not run, so give it a turn before each lookup.
+        """
+        if threading.current_thread() is threading.main_thread():
+            Cocoa.NSRunLoop.currentRunLoop().runUntilDate_(Cocoa.NSDate.date())
+
+    def activate(self, record: Dict[str, Any]) -> bool:
+        return bool(record["handle"].activateWithOptions_(Cocoa.NSApplicationActivateIgnoringOtherApps))
+
+
+class _AppRegistry:
+    """Running applications indexed by name, bundle id and pid.
+
+    Loaded from the provider on first use and kept current by its launch and
+    terminate notifications. A lookup miss triggers a full reload, at most once
+    per miss_refresh_interval, in case a notification was missed.
+    """
+
+    def __init__(self, provider: Any = None, miss_refresh_interval: float = 1.0):
+        self._provider = provider
+        self.miss_refresh_interval = miss_refresh_interval
+        self._refreshed_at = 0.0
+        self._by_pid: Dict[int, Dict[str, Any]] = {}
+        self._by_name: Dict[str, List[int]] = {}
+        self._by_bundle_id: Dict[str, List[int]] = {}
+        self._loaded = False
+        self._lock = threading.RLock()
+
+    @property
+    def provider(self) -> Any:
+        if self._provider is None:
+            self._provider = _NSWorkspaceAppProvider()
+        return self._provider
+
+    def _add(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self._remove(record)
+            self._by_pid[record["pid"]] = record
+            self._by_name.setdefault(record["name"].lower(), []).append(record["pid"])
+            if record["bundle_id"]:
+                self._by_bundle_id.setdefault(record["bundle_id"].lower(), []).append(record["pid"])
+
+    def _remove(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            existing = self._by_pid.pop(record["pid"], None)
+            if existing is None:
+                return
+            for index, key in ((self._by_name, existing["name"].lower()),
+                               (self._by_bundle_id, (existing["bundle_id"] or "").lower())):
+                pids = index.get(key)
+                if pids and existing["pid"] in pids:
+                    pids.remove(existing["pid"])
+                    if not pids:
+                        del index[key]
+
+    def refresh(self) -> None:
+        """Rebuild the indexes from the provider's full application list."""
+        with self._lock:
+            records = self.provider.running_applications()
+            self._refreshed_at = time.time()
+            self._by_pid, self._by_name, self._by_bundle_id = {}, {}, {}
+            for record in records:
+                self._add(record)
+
+    def _ensure_current(self) -> None:
+        with self._lock:
+            if not self._loaded:
+                # Subscribe first so launches during the initial load are not missed
+                self.provider.subscribe(self._add, self._remove)
+                self.refresh()
+                self._loaded = True
+            else:
+                self.provider.pump()
+
+    def apps(self, include_background: bool = False) -> List[Dict[str, Any]]:
+        """Running applications in launch order."""
+        self._ensure_current()
+        with self._lock:
+            return [
+                record for record in self._by_pid.values()
+                if include_background or not record["background_only"]
+            ]
+
+    def _lookup(self, name_or_bundle_id: str) -> List[Dict[str, Any]]:
+        key = name_or_bundle_id.lower()
+        pids = self._by_name.get(key) or self._by_bundle_id.get(key) or []
+        return [self._by_pid[pid] for pid in pids]
+
+    def find_all(self, name_or_bundle_id: str) -> List[Dict[str, Any]]:
+        """Find every running process with this name or bundle id (case-insensitive)."""
+        self._ensure_current()
+        with self._lock:
+            records = self._lookup(name_or_bundle_id)
+            if not records and time.time() - self._refreshed_at > self.miss_refresh_interval:
+                self.refresh()
+                records = self._lookup(name_or_bundle_id)
+            return records
+
+    def find(self, name_or_bundle_id: str) -> Optional[Dict[str, Any]]:
+        """Find a running application by name or bundle id (case-insensitive)."""
+        records = self.find_all(name_or_bundle_id)
+        if not records:
+            return None
+        # Prefer a regular app over a background process with the same name
+        return next((record for record in records if not record["background_only"]), records[0])
+
+    def find_pid(self, pid: int) -> Optional[Dict[str, Any]]:
+        self._ensure_current()
+        with self._lock:
+            return self._by_pid.get(pid)
+
+
+def _public_app_info(record: Dict[str, Any]) -> Dict[str, Any]:
+    return {"name": record["name"], "bundle_id": record["bundle_id"], "pid": record["pid"]}
+
+
+app_registry = _AppRegistry()
+
+
+def _main_display_pixel_size() -> tuple[int, int]:
+    """Pixel size of the main display, which matches the screenshot size.
+
+    Queried on every call so resolution and display changes are picked up.
+    """
+    try:
+        mode = Quartz.CGDisplayCopyDisplayMode(Quartz.CGMainDisplayID())
+        return Quartz.CGDisplayModeGetPixelWidth(mode), Quartz.CGDisplayModeGetPixelHeight(mode)
+    except Exception:
+        screenshot = pyautogui.screenshot()
+        return screenshot.width, screenshot.height
 
 
 def _scale_coordinates_for_display(x: int, y: int) -> tuple[int, int]:
@@ -99,6 +887,16 @@ def type_text(text: str) -> Dict[str, Any]:
     return {"success": True, "message": f"Typed: {text}"}
 
 
+def _post_vertical_scroll(dy: int) -> None:
+    """Post a pixel-based scroll wheel event (positive dy = scroll down)."""
+    # Scroll wheel events: positive = up, negative = down
+    # We want intuitive behavior: positive dy = scroll down, negative dy = scroll up
+    Quartz.CGEventPost(
+        Quartz.kCGHIDEventTap,
+        Quartz.CGEventCreateScrollWheelEvent(None, Quartz.kCGScrollEventUnitPixel, 1, -dy)
+    )
+
+
 @mcp.tool()
 def scroll(dx: int = 0, dy: int = 0) -> Dict[str, Any]:
     
@@ -107,10 +905,8 @@ def scroll(dx: int = 0, dy: int = 0) -> Dict[str, Any]:
         dx: Horizontal scroll pixel delta (positive = right, negative = left)
         dy: Vertical scroll pixel delta (positive = down, negative = up)
     """
-    # pyautogui.scroll: positive = up, negative = down
-    # We want intuitive behavior: positive dy = scroll down, negative dy = scroll up
     if dy != 0:
-        CGEventPost(kCGHIDEventTap, CGEventCreateScrollWheelEvent(None, kCGScrollEventUnitPixel, 1, -dy))
+        _post_vertical_scroll(dy)
     if dx != 0:
         # pyautogui.hscroll: positive = right, negative = left (already correct)
         pyautogui.hscroll(clicks=dx)
@@ -329,12 +1125,37 @@ def keyboard_shortcut_refresh() -> Dict[str, Any]:
     return _execute_applescript_keystroke('keystroke "r" using {command down}', "Refresh (Cmd+R)")
 
 
+# Seconds to wait for an in-process activation to take effect before falling back to AppleScript
+_IN_PROCESS_ACTIVATION_WAIT = 1.0
+
+
+def _looks_like_bundle_id(app_name: str) -> bool:
+    """Whether an app argument is a reverse-DNS bundle id such as com.apple.Safari."""
+    parts = app_name.split(".")
+    return len(parts) >= 3 and all(part and " " not in part for part in parts)
+
+
+def _matches_app(active_app: Dict[str, Any], app_name: str, target: Optional[Dict[str, Any]]) -> bool:
+    """Whether an NSWorkspace active application entry is the requested app."""
+    if target is not None and active_app.get("NSApplicationProcessIdentifier", -1) == target["pid"]:
+        return True
+    return app_name.lower() in (
+        str(active_app.get("NSApplicationName", "")).lower(),
+        str(active_app.get("NSApplicationBundleIdentifier", "")).lower()
+    )
+
+
+def _is_active_app(app_name: str, target: Optional[Dict[str, Any]]) -> bool:
+    active_app = Cocoa.NSWorkspace.sharedWorkspace().activeApplication()
+    return bool(active_app) and _matches_app(active_app, app_name, target)
+
+
 @mcp.tool()
 def focus_app(app_name: str, timeout: int = 30) -> Dict[str, Any]:
     """Bring the specified application to the foreground and wait for it to become active.
     
     Args:
-        app_name: Name of the application to focus
+        app_name: Name or bundle id of the application to focus
         timeout: Maximum time to wait for app to become active (default: 30 seconds)
     """
     if not app_name:
@@ -343,20 +1164,45 @@ def focus_app(app_name: str, timeout: int = 30) -> Dict[str, Any]:
     if timeout <= 0:
         raise ValueError("timeout must be positive")
     
-    # First, try to activate the app
-    script = f'tell application "{app_name}" to activate'
+    # First, try to activate the app: in-process if it is running, otherwise
+    # through AppleScript, which also launches it
+    target = None
+    activated = False
+    if _accessibility_available():
+        try:
+            target = app_registry.find(app_name)
+            if target is not None and app_registry.provider.activate(target):
+                # A background process's activation request can be accepted without the
+                # app coming to the front (macOS 14+), so confirm it before relying on it
+                deadline = time.time() + _IN_PROCESS_ACTIVATION_WAIT
+                while not activated and time.time() < deadline:
+                    time.sleep(0.1)
+                    activated = _is_active_app(app_name, target)
+        except Exception:
+            pass
     
-    result = subprocess.run(
-        ["osascript", "-e", script],
-        capture_output=True,
-        text=True
-    )
+    if not activated:
+        if target is not None and target["bundle_id"]:
+            script = f'tell application id "{target["bundle_id"]}" to activate'
+        elif _looks_like_bundle_id(app_name):
+            script = f'tell application id "{app_name}" to activate'
+        else:
+            script = f'tell application "{app_name}" to activate'
+        
+        result = subprocess.run(
+            ["osascript", "-e", script],
+            capture_output=True,
+            text=True
+        )
+        
+        if result.returncode != 0:
+            return {
+                "success": False, 
+                "message": f"Failed to activate app '{app_name}': {result.stderr.strip()}"
+            }
     
-    if result.returncode != 0:
-        return {
-            "success": False, 
-            "message": f"Failed to activate app '{app_name}': {result.stderr.strip()}"
-        }
+    # Activation reorders windows before the screen change detector may notice
+    window_cache.invalidate()
     
     # Wait for the app to become the active application
     start_time = time.time()
@@ -364,13 +1210,14 @@ def focus_app(app_name: str, timeout: int = 30) -> Dict[str, Any]:
     
     while time.time() - start_time < timeout:
         try:
-            if ACCESSIBILITY_AVAILABLE:
+            if _accessibility_available():
                 # Use Cocoa NSWorkspace to check active app
-                workspace = NSWorkspace.sharedWorkspace()
+                workspace = Cocoa.NSWorkspace.sharedWorkspace()
                 active_app = workspace.activeApplication()
                 if active_app:
                     active_app_name = active_app.get("NSApplicationName", "")
-                    if active_app_name.lower() == app_name.lower():
+                    active_app_pid = active_app.get("NSApplicationProcessIdentifier", -1)
+                    if _matches_app(active_app, app_name, target):
                         elapsed_time = round(time.time() - start_time, 2)
                         return {
                             "success": True, 
@@ -379,7 +1226,7 @@ def focus_app(app_name: str, timeout: int = 30) -> Dict[str, Any]:
                             "active_app": {
                                 "name": active_app_name,
                                 "bundle_id": active_app.get("NSApplicationBundleIdentifier", "Unknown"),
-                                "pid": active_app.get("NSApplicationProcessIdentifier", -1)
+                                "pid": active_app_pid
                             }
                         }
                     last_active_app = active_app_name
@@ -422,20 +1269,187 @@ def focus_app(app_name: str, timeout: int = 30) -> Dict[str, Any]:
 
 
 @mcp.tool()
-def get_screen_layout() -> str:
-    """Get information about windows and applications currently visible on the screen."""
-    return _get_screen_content_accessibility()
+def get_screen_layout(
+    app: Optional[str] = None,
+    pid: Optional[int] = None,
+    min_width: int = 50,
+    min_height: int = 50,
+    refresh: bool = False
+) -> str:
+    """Get information about windows and applications currently visible on the screen.
+
+    Window state is cached and refreshed when the screen changes.
+
+    Args:
+        app: Only include windows of the application with this name or bundle id
+        pid: Only include windows of the process with this id
+        min_width: Only include windows at least this wide (default: 50)
+        min_height: Only include windows at least this tall (default: 50)
+        refresh: Re-read window state even if the cache is current (default: False)
+    """
+    return _get_screen_content_accessibility(app, pid, min_width, min_height, refresh)
+
+
+@mcp.tool()
+def get_screen_text(languages: Optional[List[str]] = None) -> str:
+    """Get all text currently visible on the screen using OCR.
+
+    Args:
+        languages: easyocr language codes to read, e.g. ["en", "de"] (default: ["en"])
+    """
+    return _get_screen_content_ocr(languages)
+
+
+@mcp.tool()
+def read_scrolling_region(
+    x: int, y: int, width: int, height: int,
+    step: int = 300, max_steps: int = 20, settle_time: float = 0.3,
+    languages: Optional[List[str]] = None
+) -> str:
+    """Read long content by scrolling a region down and stitching the text of each step.
+
+    Only newly exposed content is OCRed on each step, and reading stops when the content stops moving.
+    Coordinates are in the same screen space as get_screen_text positions.
+
+    Args:
+        x: Left edge of the scrollable region
+        y: Top edge of the scrollable region
+        width: Width of the region
+        height: Height of the region
+        step: Scroll distance per step in pixels, reduced if needed so frames overlap (default: 300)
+        max_steps: Maximum number of scroll steps (default: 20)
+        settle_time: Seconds to wait after each scroll before capturing (default: 0.3)
+        languages: easyocr language codes to read (default: ["en"])
+    """
+    if width <= 0 or height <= 0:
+        raise ValueError("width and height must be positive")
+    if height <= _SCROLL_STRIP_MARGIN + _SCROLL_MIN_OVERLAP_ROWS:
+        raise ValueError(f"height must be greater than {_SCROLL_STRIP_MARGIN + _SCROLL_MIN_OVERLAP_ROWS}")
+    if x < 0 or y < 0:
+        raise ValueError("x and y must not be negative")
+    if step <= 0:
+        raise ValueError("step must be positive")
+    if max_steps < 0:
+        raise ValueError("max_steps must not be negative")
+
+    return _read_scrolling_region(x, y, width, height, step, max_steps, settle_time, languages)
+
+
+@mcp.tool()
+def start_screen_change_detection(fps: float = DEFAULT_CHANGE_DETECTION_FPS) -> str:
+    """Start sampling the screen in the background to detect which areas change.
+
+    While running, get_screen_text reuses its last result when the screen has not changed.
+
+    Args:
+        fps: Samples per second (default: 2.0)
+    """
+    if fps <= 0:
+        raise ValueError("fps must be positive")
+
+    screen_changes.start(fps)
+    return json.dumps({
+        "success": True,
+        "change_detection": screen_changes.status(),
+        "message": f"Screen change detection running at {fps} fps"
+    }, indent=2)
 
 
 @mcp.tool()
-def get_screen_text() -> str:
-    """Get all text currently visible on the screen using OCR."""
-    return _get_screen_content_ocr()
+def stop_screen_change_detection() -> str:
+    """Stop background screen change detection."""
+    screen_changes.stop()
+    return json.dumps({
+        "success": True,
+        "change_detection": screen_changes.status(),
+        "message": "Screen change detection stopped"
+    }, indent=2)
 
 
-def _get_screen_content_accessibility() -> str:
+@mcp.tool()
+def get_screen_changes(since_sequence: int = 0) -> str:
+    """Get the dirty rectangles of screen changes detected after the given event sequence number.
+
+    Pass the returned "sequence" on the next call to receive only newer changes.
+
+    Args:
+        since_sequence: Return only change events with a higher sequence number (default: 0)
+    """
+    events = screen_changes.events_since(since_sequence)
+    return json.dumps({
+        "success": True,
+        "sequence": screen_changes.sequence,
+        "events": events,
+        "change_detection": screen_changes.status(),
+        "message": f"Found {len(events)} screen change events"
+    }, indent=2)
+
+
+@mcp.tool()
+def wait_for_screen_change(
+    timeout: float = 10,
+    x: Optional[int] = None, y: Optional[int] = None,
+    width: Optional[int] = None, height: Optional[int] = None
+) -> str:
+    """Wait until the screen (or a region of it) changes.
+
+    Args:
+        timeout: Maximum time to wait in seconds (default: 10)
+        x: Left edge of the region to watch (default: whole screen)
+        y: Top edge of the region to watch
+        width: Width of the region to watch
+        height: Height of the region to watch
+    """
+    if timeout <= 0:
+        raise ValueError("timeout must be positive")
+
+    region = None
+    if None not in (x, y, width, height):
+        region = {"x": x, "y": y, "width": width, "height": height}
+    elif any(value is not None for value in (x, y, width, height)):
+        raise ValueError("x, y, width and height must be given together")
+
+    start_time = time.time()
+    try:
+        event = screen_changes.wait_for_change(timeout, region)
+    except Exception as e:
+        return json.dumps({
+            "success": False,
+            "error": str(e),
+            "message": "Failed to watch the screen for changes"
+        }, indent=2)
+
+    elapsed_time = round(time.time() - start_time, 2)
+    if event is None:
+        return json.dumps({
+            "success": False,
+            "message": f"No screen change after {timeout}s",
+            "elapsed_time": elapsed_time
+        }, indent=2)
+
+    return json.dumps({
+        "success": True,
+        "event": event,
+        "elapsed_time": elapsed_time,
+        "message": f"Screen changed after {elapsed_time}s"
+    }, indent=2)
+
+
+@mcp.tool()
+def get_ocr_reader_status() -> str:
+    """Get the loaded OCR language models, their memory use and recent load/evict events."""
+    return json.dumps({"success": True, "ocr_readers": ocr_readers.status()}, indent=2)
+
+
+def _get_screen_content_accessibility(
+    app: Optional[str] = None,
+    pid: Optional[int] = None,
+    min_width: int = 50,
+    min_height: int = 50,
+    refresh: bool = False
+) -> str:
     """Get screen content using macOS accessibility APIs."""
-    if not ACCESSIBILITY_AVAILABLE:
+    if not _accessibility_available():
         return json.dumps({
             "success": False,
             "error": "macOS accessibility frameworks not available",
@@ -445,14 +1459,14 @@ def _get_screen_content_accessibility() -> str:
     try:
         screen_info = {
             "mode": "accessibility",
-            "timestamp": str(subprocess.run(["date"], capture_output=True, text=True).stdout.strip()),
+            "timestamp": _timestamp(),
             "windows": [],
             "active_app": None
         }
         
         # Get active application
         try:
-            workspace = NSWorkspace.sharedWorkspace()
+            workspace = Cocoa.NSWorkspace.sharedWorkspace()
             active_app = workspace.activeApplication()
             if active_app:
                 screen_info["active_app"] = {
@@ -463,45 +1477,28 @@ def _get_screen_content_accessibility() -> str:
         except Exception as e:
             screen_info["active_app_error"] = str(e)
         
-        # Get window information using Quartz
+        # Get window information from the window cache
         try:
-            window_list = CGWindowListCopyWindowInfo(kCGWindowListOptionOnScreenOnly, kCGNullWindowID)
-            
-            for window in window_list:
-                # Skip windows without titles or that are too small
-                window_name = window.get('kCGWindowName', '')
-                window_bounds = window.get('kCGWindowBounds', {})
-                
-                if (window_name and 
-                    window_bounds.get('Width', 0) > 50 and 
-                    window_bounds.get('Height', 0) > 50):
-                    
-                    window_info = {
-                        "title": window_name,
-                        "app": window.get('kCGWindowOwnerName', 'Unknown'),
-                        "bounds": {
-                            "x": int(window_bounds.get('X', 0)),
-                            "y": int(window_bounds.get('Y', 0)),
-                            "width": int(window_bounds.get('Width', 0)),
-                            "height": int(window_bounds.get('Height', 0))
-                        },
-                        "layer": window.get('kCGWindowLayer', 0),
-                        "pid": window.get('kCGWindowOwnerPID', -1)
-                    }
-                    screen_info["windows"].append(window_info)
-        
+            # Resolve app names and bundle ids to the pids of every matching process
+            pids = None
+            if app and pid is None:
+                records = app_registry.find_all(app)
+                if records:
+                    app, pids = None, [record["pid"] for record in records]
+            windows, cache_info = window_cache.windows(
+                app=app, pid=pid, pids=pids, min_width=min_width, min_height=min_height, refresh=refresh
+            )
+            screen_info["windows"] = windows
+            screen_info["window_cache"] = cache_info
         except Exception as e:
             screen_info["windows_error"] = str(e)
         
-        # Sort windows by layer (front to back)
-        screen_info["windows"].sort(key=lambda w: w.get("layer", 0))
-        
         # Get screen size
         try:
-            screenshot = pyautogui.screenshot()
+            width, height = _main_display_pixel_size()
             screen_info["screen_size"] = {
-                "width": screenshot.width,
-                "height": screenshot.height
+                "width": width,
+                "height": height
             }
         except Exception as e:
             screen_info["screen_size_error"] = str(e)
@@ -520,9 +1517,24 @@ def _get_screen_content_accessibility() -> str:
         }, indent=2)
 
 
-def _get_screen_content_ocr() -> str:
+# Last OCR result per language set, with the change event sequence it was captured at
+_ocr_cache: Dict[tuple, tuple[int, Dict[str, Any]]] = {}
+
+
+def _get_screen_content_ocr(languages: Optional[List[str]] = None) -> str:
     """Get screen content using OCR to read all text on screen."""
+    reader_events = []
     try:
+        # While change detection runs, reuse the last result if the screen has not changed since
+        cache_key = ocr_readers.normalize_languages(languages)
+        if screen_changes.running:
+            # Pick up changes made since the last background sample
+            screen_changes.sample()
+            cached = _ocr_cache.get(cache_key)
+            if cached is not None and cached[0] == screen_changes.sequence:
+                return json.dumps({**cached[1], "cached": True}, indent=2)
+        sequence = screen_changes.sequence
+
         # Take screenshot
         screenshot = pyautogui.screenshot()
         
@@ -530,11 +1542,13 @@ def _get_screen_content_ocr() -> str:
         screenshot_array = np.array(screenshot)
         
         # Use OCR to extract all text
-        results = reader.readtext(screenshot_array)
+        with ocr_readers.reader(languages, reader_events) as reader:
+            results = reader.readtext(screenshot_array)
         
         screen_info = {
             "mode": "ocr",
-            "timestamp": str(subprocess.run(["date"], capture_output=True, text=True).stdout.strip()),
+            "languages": list(ocr_readers.normalize_languages(languages)),
+            "timestamp": _timestamp(),
             "screen_size": {
                 "width": screenshot.width,
                 "height": screenshot.height
@@ -546,7 +1560,7 @@ def _get_screen_content_ocr() -> str:
         all_text_lines = []
         
         for (bbox, detected_text, confidence) in results:
-            if confidence > 0.3:  # Lower threshold for general screen reading
+            if confidence > OCR_MIN_CONFIDENCE:
                 x1, y1 = bbox[0]
                 x2, y2 = bbox[2]
                 center_x = int((x1 + x2) / 2)
@@ -571,45 +1585,226 @@ def _get_screen_content_ocr() -> str:
         # Create full text representation
         screen_info["full_text"] = "\n".join([elem["text"] for elem in screen_info["text_elements"]])
         
-        return json.dumps({
+        result = {
             "success": True,
             "screen_info": screen_info,
+            "reader_events": reader_events,
             "message": f"Found {len(screen_info['text_elements'])} text elements on screen"
-        }, indent=2)
+        }
+        if screen_changes.running:
+            _ocr_cache[cache_key] = (sequence, {**result, "reader_events": []})
+        return json.dumps(result, indent=2)
         
     except Exception as e:
         return json.dumps({
             "success": False,
             "error": str(e),
+            "reader_events": reader_events,
             "message": "Failed to get screen content using OCR"
         }, indent=2)
 
 
+# Rows of already-read content re-OCRed above each new strip so lines on the boundary are read whole
+_SCROLL_STRIP_MARGIN = 60
+# Minimum number of non-blank overlapping rows needed to trust a frame alignment
+_SCROLL_MIN_OVERLAP_ROWS = 8
+
+
+def _row_hashes(frame: "np.ndarray") -> "tuple[np.ndarray, np.ndarray]":
+    """Hash every pixel row of a frame.
+
+    Returns the row hashes and a mask of rows that are not a single flat color.
+    Flat rows (blank background) match at any offset and are ignored when aligning frames.
+    """
+    hashes = np.array([hash(row.tobytes()) for row in frame], dtype=np.int64)
+    flat_rows = frame.reshape(frame.shape[0], -1)
+    informative = (flat_rows != flat_rows[:, :1]).any(axis=1)
+    return hashes, informative
+
+
+def _find_scroll_shift(
+    prev_hashes: "np.ndarray",
+    prev_informative: "np.ndarray",
+    curr_hashes: "np.ndarray",
+    expected_shift: Optional[int] = None,
+    min_match: float = 0.9
+) -> Optional[int]:
+    """Find how many rows the content moved up between two frames of the same height.
+
+    Returns 0 when the content did not move and None when no overlap was found.
+    """
+    height = len(prev_hashes)
+    candidates = []
+    for shift in range(height):
+        weights = prev_informative[shift:]
+        total = int(weights.sum())
+        if total < _SCROLL_MIN_OVERLAP_ROWS:
+            break
+        matches = prev_hashes[shift:] == curr_hashes[:height - shift]
+        score = int((matches & weights).sum()) / total
+        if score >= min_match:
+            candidates.append((score, shift))
+
+    if not candidates:
+        return None
+
+    # Repetitive content can align at several offsets; prefer the one closest to the scroll distance
+    best_score = max(score for score, _ in candidates)
+    close_candidates = [shift for score, shift in candidates if score >= best_score - 0.01]
+    if expected_shift is None:
+        return close_candidates[0]
+    return min(close_candidates, key=lambda shift: abs(shift - expected_shift))
+
+
+def _read_scrolling_region(
+    x: int, y: int, width: int, height: int,
+    step: int, max_steps: int, settle_time: float,
+    languages: Optional[List[str]]
+) -> str:
+    """Scroll a region and OCR only the content exposed by each scroll step."""
+    reader_events = []
+    try:
+        def capture() -> "np.ndarray":
+            return np.array(pyautogui.screenshot())[y:y + height, x:x + width]
+
+        screenshot = pyautogui.screenshot()
+        frame = np.array(screenshot)[y:y + height, x:x + width]
+        if frame.shape[0] != height or frame.shape[1] != width:
+            raise ValueError("region must lie within the screen")
+
+        # Scroll events are in logical pixels, frames are in screenshot pixels
+        screen_width, screen_height = pyautogui.size()
+        scale = screenshot.height / screen_height
+
+        # Consecutive frames must overlap to be aligned, so never scroll further than the
+        # region height minus the re-read margin
+        max_shift = height - _SCROLL_STRIP_MARGIN
+        if step * scale > max_shift:
+            step = max(1, int(max_shift / scale))
+        expected_shift = int(step * scale)
+
+        # Point the mouse at the region so scroll events reach it
+        center_x, center_y = _scale_coordinates_for_display(x + width // 2, y + height // 2)
+        pyautogui.moveTo(x=center_x, y=center_y)
+
+        text_elements = []
+        frame_offset = 0  # Content y of the top of the current frame
+        read_until = 0  # Content above this y has been read
+        steps = 0
+        gaps = 0
+        stopped_reason = "max_steps"
+
+        with ocr_readers.reader(languages, reader_events) as reader:
+            while True:
+                is_last = steps >= max_steps or stopped_reason == "end_of_content"
+                strip_top = max(0, read_until - frame_offset - _SCROLL_STRIP_MARGIN)
+                results = reader.readtext(frame[strip_top:]) if strip_top < height else []
+
+                # Lines cut off by the bottom edge are deferred to the next frame
+                next_read_until = frame_offset + height
+                detections = []
+                for (bbox, detected_text, confidence) in results:
+                    if confidence <= OCR_MIN_CONFIDENCE:
+                        continue
+                    top = strip_top + min(point[1] for point in bbox)
+                    bottom = strip_top + max(point[1] for point in bbox)
+                    if bottom >= height - 2 and not is_last:
+                        next_read_until = min(next_read_until, frame_offset + int(top))
+                        continue
+                    detections.append((bbox, detected_text, confidence))
+
+                for (bbox, detected_text, confidence) in detections:
+                    x1, y1 = bbox[0]
+                    x2, y2 = bbox[2]
+                    content_y = frame_offset + strip_top + int((y1 + y2) / 2)
+                    if not read_until <= content_y < next_read_until:
+                        continue
+                    text_elements.append({
+                        "text": detected_text.strip(),
+                        "confidence": round(confidence, 3),
+                        "position": {
+                            "center_x": x + int((x1 + x2) / 2),
+                            "content_y": content_y
+                        }
+                    })
+                read_until = next_read_until
+
+                if is_last:
+                    break
+
+                prev_hashes, prev_informative = _row_hashes(frame)
+                _post_vertical_scroll(step)
+                time.sleep(settle_time)
+                frame = capture()
+                steps += 1
+                curr_hashes, _ = _row_hashes(frame)
+
+                shift = _find_scroll_shift(prev_hashes, prev_informative, curr_hashes, expected_shift)
+                if shift == 0:
+                    # Content stopped moving: this frame has nothing new, flush deferred lines
+                    stopped_reason = "end_of_content"
+                    continue
+                if shift is None:
+                    # Jumped further than one frame: assume contiguous content and read the whole frame
+                    gaps += 1
+                    shift = height
+                    read_until = frame_offset + height
+                frame_offset += shift
+
+        text_elements.sort(key=lambda elem: (elem["position"]["content_y"], elem["position"]["center_x"]))
+
+        message = f"Read {len(text_elements)} text elements over {steps} scroll steps ({stopped_reason})"
+        if gaps:
+            message = f"Content moved further than the region between {gaps} scroll steps, text may be missing. " + message
+
+        return json.dumps({
+            "success": gaps == 0,
+            "scroll_info": {
+                "mode": "ocr_scrolling",
+                "region": {"x": x, "y": y, "width": width, "height": height},
+                "languages": list(ocr_readers.normalize_languages(languages)),
+                "step": step,
+                "steps": steps,
+                "stopped_reason": stopped_reason,
+                "content_height": frame_offset + height,
+                "gaps": gaps,
+                "text_elements": text_elements,
+                "full_text": "\n".join(elem["text"] for elem in text_elements)
+            },
+            "reader_events": reader_events,
+            "message": message
+        }, indent=2)
+
+    except Exception as e:
+        return json.dumps({
+            "success": False,
+            "error": str(e),
+            "reader_events": reader_events,
+            "message": "Failed to read scrolling region"
+        }, indent=2)
+
 
 @mcp.tool()
 def get_available_apps() -> str:
     """Get a list of all running applications."""
-    script = '''
-    tell application "System Events"
-        get name of (processes where background only is false)
-    end tell
-    '''
-    
-    result = subprocess.run(
-        ["osascript", "-e", script],
-        capture_output=True,
-        text=True
-    )
-    
-    if result.returncode != 0:
-        raise RuntimeError(f"Failed to get apps: {result.stderr}")
+    if not _accessibility_available():
+        raise RuntimeError("Failed to get apps: macOS accessibility frameworks not available")
     
-    apps = [app.strip() for app in result.stdout.split(", ")]
-    return json.dumps({"success": True, "apps": apps}, indent=2)
+    records = app_registry.apps()
+    return json.dumps({
+        "success": True,
+        "apps": [record["name"] for record in records],
+        "details": [_public_app_info(record) for record in records]
+    }, indent=2)
 
 
 def main():
     """Entry point for the MCP server."""
+    preload = os.environ.get("AUTOMAC_PRELOAD", "")
+    if preload:
+        threading.Thread(
+            target=_preload_tool_groups, args=(preload.split(","),), daemon=True
+        ).start()
     mcp.run()
 
 
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Measure the CPU cost of one screen change detection sample.
+
+By default frames are synthetic screenshots at Retina resolution, so only the
+grayscale conversion, downscaling, block hashing and dirty rectangle merging are
+measured. Pass --capture to sample the real screen (macOS) and include capture cost,
+including the CPU time of capture child processes.
+
+Usage: python benchmarks/bench_change_detector.py [--capture] [--frames N] [--width W] [--height H]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from PIL import Image
+
+import automac_mcp
+
+
+def synthetic_capture(width: int, height: int, downscale: int):
+    """Return a capture function producing mostly static frames with a small moving change."""
+    rng = np.random.default_rng(0)
+    base = rng.integers(0, 255, size=(height, width, 3), dtype=np.uint8)
+    state = {"frame": 0}
+
+    def capture() -> np.ndarray:
+        frame = base.copy()
+        # A cursor-sized change that moves every frame
+        offset = (state["frame"] * 37) % (height - 40)
+        frame[offset:offset + 40, 100:400] = 255
+        state["frame"] += 1
+        return np.array(Image.fromarray(frame).convert("L").reduce(downscale))
+
+    return capture
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--capture", action="store_true", help="sample the real screen")
+    parser.add_argument("--frames", type=int, default=50)
+    parser.add_argument("--width", type=int, default=2880)
+    parser.add_argument("--height", type=int, default=1800)
+    args = parser.parse_args()
+
+    capture = None
+    if not args.capture:
+        capture = synthetic_capture(args.width, args.height, automac_mcp._CHANGE_DETECTION_DOWNSCALE)
+    detector = automac_mcp._ScreenChangeDetector(capture=capture)
+
+    detector.sample()  # baseline frame, not counted
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    # On macOS pyautogui captures through a `screencapture` child process
+    children_start = os.times()
+    events = sum(1 for _ in range(args.frames) if detector.sample() is not None)
+    children_end = os.times()
+    process_cpu_per_frame = (time.process_time() - cpu_start) / args.frames
+    child_cpu_per_frame = (
+        (children_end.children_user - children_start.children_user)
+        + (children_end.children_system - children_start.children_system)
+    ) / args.frames
+    cpu_per_frame = process_cpu_per_frame + child_cpu_per_frame
+    wall_per_frame = (time.perf_counter() - wall_start) / args.frames
+
+    source = "screen capture" if args.capture else f"synthetic {args.width}x{args.height} frames"
+    fps = automac_mcp.DEFAULT_CHANGE_DETECTION_FPS
+    print(f"Screen change detector ({args.frames} samples, {source})")
+    print(f"  CPU per sample:  {cpu_per_frame * 1000:.2f} ms "
+          f"({process_cpu_per_frame * 1000:.2f} ms in process, {child_cpu_per_frame * 1000:.2f} ms in child processes)")
+    print(f"  wall per sample: {wall_per_frame * 1000:.2f} ms")
+    print(f"  CPU at {fps} fps:  {cpu_per_frame * fps * 100:.1f}% of one core")
+    print(f"  change events:   {events}")
+
+
+if __name__ == "__main__":
+    main()
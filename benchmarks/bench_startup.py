@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Measure AutoMac MCP startup cost.
+
+Reports, over several fresh interpreters:
+  - the time to import automac_mcp
+  - the time from launching the server to receiving its tool list over stdio
+
+Usage: python benchmarks/bench_startup.py [runs]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_SNIPPET = (
+    "import time; start = time.perf_counter(); import automac_mcp; "
+    "print(time.perf_counter() - start)"
+)
+
+
+def measure_import() -> float:
+    """Time a bare import of the module in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def _send(process: subprocess.Popen, message: dict) -> None:
+    process.stdin.write(json.dumps(message) + "\n")
+    process.stdin.flush()
+
+
+def _read_response(process: subprocess.Popen, request_id: int) -> dict:
+    while True:
+        line = process.stdout.readline()
+        if not line:
+            raise RuntimeError("server exited before responding")
+        message = json.loads(line)
+        if message.get("id") == request_id:
+            return message
+
+
+def measure_time_to_tool_list() -> tuple[float, int]:
+    """Time from launching the server until its tool list has been received."""
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "automac_mcp.py"],
+        cwd=ROOT,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True
+    )
+    try:
+        _send(process, {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {},
+                "clientInfo": {"name": "bench_startup", "version": "0"}
+            }
+        })
+        _read_response(process, 1)
+        _send(process, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+        _send(process, {"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+        tools = _read_response(process, 2)["result"]["tools"]
+        return time.perf_counter() - start, len(tools)
+    finally:
+        process.terminate()
+        process.wait(timeout=5)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    import_times = [measure_import() for _ in range(runs)]
+    tool_list_times = []
+    tool_count = 0
+    for _ in range(runs):
+        elapsed, tool_count = measure_time_to_tool_list()
+        tool_list_times.append(elapsed)
+
+    print(f"Startup benchmark ({runs} runs)")
+    print(f"  import automac_mcp:   median {statistics.median(import_times) * 1000:.0f} ms, "
+          f"max {max(import_times) * 1000:.0f} ms")
+    print(f"  launch to tools/list: median {statistics.median(tool_list_times) * 1000:.0f} ms, "
+          f"max {max(tool_list_times) * 1000:.0f} ms ({tool_count} tools)")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,10 @@ import subprocess
 import time
 import sys
 
+# Importing the server must not pull in the heavy UI, OCR or pyobjc dependencies
+IMPORT_TIME_BUDGET_SECONDS = 1.5
+DEFERRED_MODULES = ['pyautogui', 'easyocr', 'torch', 'numpy', 'Cocoa', 'Quartz']
+
 
 def test_mcp_server():
     """Test the FastMCP server by running it and checking output"""
@@ -21,7 +25,7 @@ def test_mcp_server():
         )
         
         # Give it a moment to start
-        time.sleep(2)
+        time.sleep(0.5)
         
         # Check if process is running
         if process.poll() is None:
@@ -125,6 +129,320 @@ def test_mcp_server():
     return True
 
 
+def test_import_time_budget():
+    """Test that importing the server stays within budget and defers heavy imports"""
+    print("\nTesting import time budget...")
+    snippet = (
+        "import sys, time; start = time.perf_counter(); import automac_mcp; "
+        "elapsed = time.perf_counter() - start; "
+        f"print(elapsed, [m for m in {DEFERRED_MODULES!r} if m in sys.modules])"
+    )
+    result = subprocess.run([sys.executable, "-c", snippet], capture_output=True, text=True, check=True)
+    elapsed, loaded = result.stdout.strip().split(" ", 1)
+
+    assert loaded == "[]", f"Heavy modules imported at startup: {loaded}"
+    assert float(elapsed) < IMPORT_TIME_BUDGET_SECONDS, f"Import took {float(elapsed):.2f}s"
+    print(f"✓ Module imported in {float(elapsed):.2f}s without heavy dependencies")
+    return True
+
+
+def test_ocr_reader_pool():
+    """Test that OCR readers are loaded per language set and evicted LRU"""
+    import automac_mcp
+
+    print("\nTesting OCR reader pool...")
+    loaded = []
+
+    def fake_factory(languages):
+        loaded.append(languages)
+        return object()
+
+    # Room for two readers at the fallback size estimate
+    pool = automac_mcp._OCRReaderPool(memory_limit_mb=250, factory=fake_factory)
+    events = []
+    for languages in (['en'], ['en', 'de'], ['de', 'en'], ['en'], ['fr']):
+        with pool.reader(languages, events):
+            pass
+
+    assert loaded == [('en',), ('de', 'en'), ('fr',)]
+    assert [(e["event"], e["languages"]) for e in events] == [
+        ("load", ['en']),
+        ("load", ['de', 'en']),
+        ("evict", ['de', 'en']),
+        ("load", ['fr']),
+    ]
+    assert [r["languages"] for r in pool.status()["readers"]] == [['en'], ['fr']]
+
+    # Reloading an evicted language set makes room before the load
+    with pool.reader(['de', 'en'], events):
+        assert pool.memory_mb() <= 250
+    assert [e["event"] for e in events[-2:]] == ["evict", "load"]
+    print("✓ Readers loaded on demand and least recently used reader evicted")
+    return True
+
+
+def test_scroll_shift_detection():
+    """Test that row hashing finds how far content moved between two frames"""
+    import numpy as np
+    import automac_mcp
+
+    print("\nTesting scroll shift detection...")
+    rng = np.random.default_rng(0)
+    content = rng.integers(0, 255, size=(600, 40, 3), dtype=np.uint8)
+    # Blank rows should not anchor the alignment
+    content[100:160] = 255
+
+    prev_hashes, prev_informative = automac_mcp._row_hashes(content[0:200])
+    curr_hashes, _ = automac_mcp._row_hashes(content[75:275])
+    end_hashes, _ = automac_mcp._row_hashes(content[400:600])
+
+    assert automac_mcp._find_scroll_shift(prev_hashes, prev_informative, curr_hashes, 80) == 75
+    assert automac_mcp._find_scroll_shift(prev_hashes, prev_informative, prev_hashes, 80) == 0
+    assert automac_mcp._find_scroll_shift(prev_hashes, prev_informative, end_hashes, 80) is None
+    print("✓ Scroll shift found from overlapping rows")
+    return True
+
+
+def _run_fake_scrolling_read(step, scale=1, jump=1):
+    """Read a synthetic 90-line document through a fake screen, scroll wheel and OCR reader.
+
+    The document scrolls by jump times the requested distance; scale is the
+    screenshot pixels per logical pixel.
+    """
+    import json
+    import numpy as np
+    from PIL import Image
+    import automac_mcp
+
+    line_count, line_height, width, region_top, region_height = 90, 30, 400, 100, 400
+    document = np.full((line_count * line_height + 50, width, 3), 255, dtype=np.uint8)
+    for i in range(line_count):
+        # Each line is a bar of its own color with a distinct length
+        top = i * line_height + 8
+        document[top:top + 14, 10:60 + (i * 53) % 330] = i + 1
+    state = {"offset": 0}
+
+    class FakeScreen:
+        def size(self):
+            return (width // scale, 1600 // scale)
+
+        def screenshot(self):
+            screen = np.zeros((1600, width, 3), dtype=np.uint8)
+            screen[region_top:region_top + region_height] = document[state["offset"]:state["offset"] + region_height]
+            return Image.fromarray(screen)
+
+        def moveTo(self, **kwargs):
+            pass
+
+    def fake_scroll(dy):
+        state["offset"] = min(state["offset"] + dy * scale * jump, len(document) - region_height)
+
+    class FakeReader:
+        def readtext(self, image):
+            results = []
+            for i in range(line_count):
+                rows = np.nonzero((image[:, 10] == i + 1).all(axis=1))[0]
+                if len(rows):
+                    top, bottom = int(rows[0]), int(rows[-1]) + 1
+                    results.append(([[10, top], [100, top], [100, bottom], [10, bottom]], f"line {i}", 0.9))
+            return results
+
+    saved = (automac_mcp.pyautogui, automac_mcp._post_vertical_scroll, automac_mcp.ocr_readers)
+    automac_mcp.pyautogui = FakeScreen()
+    automac_mcp._post_vertical_scroll = fake_scroll
+    automac_mcp.ocr_readers = automac_mcp._OCRReaderPool(1024, factory=lambda languages: FakeReader())
+    try:
+        result = json.loads(automac_mcp._read_scrolling_region(
+            0, region_top, width, region_height, step, 200, 0, None
+        ))
+    finally:
+        automac_mcp.pyautogui, automac_mcp._post_vertical_scroll, automac_mcp.ocr_readers = saved
+    return result, [f"line {i}" for i in range(line_count)]
+
+
+def test_scrolling_region_stitching():
+    """Test that scrolled frames are stitched into every line exactly once"""
+    print("\nTesting scrolling region stitching...")
+    for step, scale in ((37, 1), (100, 1), (300, 1), (1000, 1), (37, 2), (100, 2), (300, 2)):
+        result, expected = _run_fake_scrolling_read(step, scale)
+        assert result["success"], result["message"]
+        assert result["scroll_info"]["stopped_reason"] == "end_of_content"
+        assert result["scroll_info"]["full_text"].split("\n") == expected, (step, scale)
+
+    # Content jumping further than the region cannot be stitched
+    result, expected = _run_fake_scrolling_read(300, jump=5)
+    assert not result["success"]
+    assert result["scroll_info"]["gaps"] > 0
+    print("✓ Every line read exactly once, and gaps reported as failures")
+    return True
+
+
+def test_screen_change_detector():
+    """Test that block hashing reports dirty rectangles only for changed areas"""
+    import numpy as np
+    import automac_mcp
+
+    print("\nTesting screen change detector...")
+    frames = [np.zeros((225, 360), dtype=np.uint8)]
+    detector = automac_mcp._ScreenChangeDetector(downscale=4, block_size=16, capture=lambda: frames[0])
+    notified = []
+    detector.add_listener(notified.append)
+
+    assert detector.sample() is None  # baseline
+    assert detector.sample() is None  # unchanged
+
+    changed = frames[0].copy()
+    changed[20:40, 100:140] = 255
+    frames[0] = changed
+    event = detector.sample()
+
+    # Blocks are 16 downscaled pixels, i.e. 64 screenshot pixels
+    assert event["rectangles"] == [{"x": 384, "y": 64, "width": 192, "height": 128}]
+    assert notified == [event]
+    assert detector.events_since(0) == [event]
+    assert detector.events_since(event["sequence"]) == []
+
+    # Partial blocks at the bottom edge (225 is not a multiple of 16) are watched too
+    changed = frames[0].copy()
+    changed[220:225, 0:10] = 255
+    frames[0] = changed
+    event = detector.sample()
+    assert event["rectangles"] == [{"x": 0, "y": 832, "width": 64, "height": 68}]
+    print("✓ Changed blocks merged into dirty rectangles and published")
+    return True
+
+
+def test_window_cache():
+    """Test that window layout queries are served from the cache until it is invalidated"""
+    import automac_mcp
+
+    print("\nTesting window cache...")
+    listings = [[
+        {"id": 1, "title": "Inbox", "app": "Mail", "bounds": {"x": 0, "y": 0, "width": 800, "height": 600},
+         "layer": 0, "z_order": 1, "pid": 10},
+        {"id": 2, "title": "", "app": "Dock", "bounds": {"x": 0, "y": 0, "width": 1440, "height": 900},
+         "layer": 20, "z_order": 0, "pid": 11},
+        {"id": 3, "title": "Tooltip", "app": "Mail", "bounds": {"x": 5, "y": 5, "width": 40, "height": 20},
+         "layer": 0, "z_order": 2, "pid": 10},
+    ]]
+    calls = []
+
+    def list_windows():
+        calls.append(1)
+        return [dict(window) for window in listings[-1]]
+
+    cache = automac_mcp._WindowCache(max_age=60, list_windows=list_windows)
+    windows, info = cache.windows(app="mail", min_width=50, min_height=50)
+    assert [w["id"] for w in windows] == [1]
+    assert info["refreshed"] and info["changes"]["added"] == [1, 2, 3]
+
+    windows, info = cache.windows(pid=10)
+    assert [w["id"] for w in windows] == [1, 3]
+    assert not info["refreshed"] and len(calls) == 1
+
+    moved = [dict(w) for w in listings[-1][:2]]
+    moved[0]["bounds"] = {"x": 100, "y": 0, "width": 800, "height": 600}
+    listings.append(moved)
+    cache.invalidate()
+    windows, info = cache.windows()
+    assert len(calls) == 2
+    assert info["changes"] == {"added": [], "removed": [3], "changed": [1], "reordered": []}
+
+    # A window opened in front shifts the others back without changing them
+    front = {"id": 9, "title": "New", "app": "Notes", "bounds": {"x": 0, "y": 0, "width": 300, "height": 300},
+             "layer": 0, "z_order": 0, "pid": 12}
+    listings.append([front] + [dict(w, z_order=w["z_order"] + 1) for w in listings[-1]])
+    cache.invalidate()
+    windows, info = cache.windows()
+    assert info["changes"] == {"added": [9], "removed": [], "changed": [], "reordered": []}
+
+    # Raising a window reports only that window as restacked
+    raised = [dict(w) for w in listings[-1]]
+    for window in raised:
+        window["z_order"] = 0 if window["id"] == 1 else window["z_order"] + (window["z_order"] < 2)
+    listings.append(raised)
+    cache.invalidate()
+    windows, info = cache.windows()
+    assert info["changes"] == {"added": [], "removed": [], "changed": [], "reordered": [1]}
+
+    # Changes that are invisible on screen are picked up once the cache is too old
+    cache.max_age = 0
+    time.sleep(0.01)
+    windows, info = cache.windows()
+    assert info["refreshed"] and len(calls) == 5
+    print("✓ Layout served from cache and refreshed after invalidation")
+    return True
+
+
+class FakeAppProvider:
+    """In-memory stand-in for NSWorkspace running-application data"""
+
+    def __init__(self, records):
+        self.records = list(records)
+        self.list_calls = 0
+        self.on_launch = None
+        self.on_terminate = None
+
+    def running_applications(self):
+        self.list_calls += 1
+        return list(self.records)
+
+    def subscribe(self, on_launch, on_terminate):
+        self.on_launch, self.on_terminate = on_launch, on_terminate
+
+    def pump(self):
+        pass
+
+    def activate(self, record):
+        return True
+
+
+def test_app_registry():
+    """Test application lookups by name, bundle id and pid, kept current by notifications"""
+    import automac_mcp
+
+    print("\nTesting application registry...")
+    records = [
+        {"name": f"App {i}", "bundle_id": f"com.example.app{i}", "pid": 1000 + i, "background_only": i % 3 == 0}
+        for i in range(2000)
+    ]
+    records.append({"name": "Acme, Inc. Reader", "bundle_id": "com.acme.reader", "pid": 42, "background_only": False})
+    provider = FakeAppProvider(records)
+    registry = automac_mcp._AppRegistry(provider)
+
+    assert registry.find("acme, inc. reader")["pid"] == 42
+    assert registry.find("COM.ACME.READER")["pid"] == 42
+    assert registry.find_pid(1001)["name"] == "App 1"
+
+    provider.on_launch({"name": "Helper", "bundle_id": "com.example.helper", "pid": 50, "background_only": True})
+    provider.on_launch({"name": "Helper", "bundle_id": "com.example.helper", "pid": 51, "background_only": False})
+    assert registry.find("helper")["pid"] == 51
+    assert [record["pid"] for record in registry.find_all("HELPER")] == [50, 51]
+    assert "Acme, Inc. Reader" in [record["name"] for record in registry.apps()]
+    assert all(not record["background_only"] for record in registry.apps())
+
+    provider.on_launch({"name": "Late App", "bundle_id": "com.example.late", "pid": 7, "background_only": False})
+    provider.on_terminate({"name": "App 1", "bundle_id": "com.example.app1", "pid": 1001, "background_only": False})
+    assert registry.find("late app")["pid"] == 7
+    assert registry.find_pid(1001) is None
+    assert provider.list_calls == 1
+
+    # Misses reload the full list at most once per interval
+    assert registry.find("Not Running") is None
+    assert registry.find("Not Running") is None
+    assert provider.list_calls == 1
+
+    lookups = 10000
+    start = time.perf_counter()
+    for i in range(lookups):
+        registry.find(f"app {2 + i % 1998}")
+    per_lookup = (time.perf_counter() - start) / lookups
+    assert provider.list_calls == 1
+    assert per_lookup < 0.0001, f"Lookup took {per_lookup * 1e6:.1f}us"
+    print(f"✓ Lookups served from memory ({per_lookup * 1e6:.1f}us each)")
+    return True
+
+
 def test_dependencies():
     """Test that all required dependencies are available"""
     print("\nTesting dependencies...")
@@ -159,7 +477,9 @@ if __name__ == "__main__":
         sys.exit(1)
     
     # Test the server
-    if test_mcp_server():
+    if (test_mcp_server() and test_import_time_budget() and test_ocr_reader_pool()
+            and test_scroll_shift_detection() and test_scrolling_region_stitching() and test_screen_change_detector()
+            and test_window_cache() and test_app_registry()):
         print("\n✅ All tests passed!")
     else:
         print("\n❌ Some tests failed!")